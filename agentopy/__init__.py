@@ -8,6 +8,12 @@ from agentopy.agent import Agent
 
 __all__ = [
     'SharedStateKeys',
+    'AGENT_MODE',
+    'AGENT_THOUGHTS',
+    'AGENT_ACTION',
+    'AGENT_ACTION_RESULT',
+    'AGENT_ACTION_ARGS',
+    'AGENT_ACTION_CONTEXT',
     'ActionResult',
     'IAgent',
     'IAgentComponent',
@@ -1,27 +1,81 @@
 import inspect
-from typing import Callable, Dict
+import sys
+import types
+from typing import Callable, Dict, Tuple, Union, get_origin
+from weakref import WeakKeyDictionary
 
 from agentopy.protocols import IAction, IState
 from agentopy.schemas import ActionResult, EntityInfo
+from agentopy.state import State, slice_by_prefixes
+
+# origins of `Union[X, Y]` / `Optional[X]` and, on Python 3.10+, of `X | Y`
+_UNION_ORIGINS = (Union, getattr(types, 'UnionType', Union))
+
+# arguments of already validated action functions, keyed by the underlying function of bound methods
+_validated_action_fns: 'WeakKeyDictionary[Callable, Dict[str, str]]' = WeakKeyDictionary()
+
+
+def _validate_action_fn(action_fn: Callable) -> Dict[str, str]:
+    """Validates the action function and returns its arguments"""
+    fn = getattr(action_fn, '__func__', action_fn)
+    try:
+        return _validated_action_fns[fn]
+    except (KeyError, TypeError):
+        pass
+
+    if not inspect.iscoroutinefunction(action_fn):
+        raise ValueError("Action function must be a coroutine function")
+    if not hasattr(action_fn, '__annotations__'):
+        raise ValueError("Action function must have type annotations")
+    # check if action_fn has caller_context argument of IState type
+    sig = inspect.signature(action_fn)
+    if 'caller_context' not in sig.parameters or sig.parameters['caller_context'].annotation != IState:
+        raise ValueError(
+            "Action function must have 'caller_context' argument of IState type or None")
+
+    arguments: Dict[str, str] = {}
+    for arg_name, value in sig.parameters.items():
+        annotation = value.annotation
+        if arg_name == 'caller_context' or annotation is inspect.Parameter.empty:
+            continue
+        if isinstance(annotation, type):
+            arguments[arg_name] = annotation.__name__
+        elif get_origin(annotation) in _UNION_ORIGINS:
+            arguments[arg_name] = ' | '.join(
+                arg.__name__ for arg in annotation.__args__)
+
+    try:
+        _validated_action_fns[fn] = arguments
+    except TypeError:
+        # not weak-referenceable, validate it again next time
+        pass
+    return arguments
 
 
 class Action(IAction):
     """Implements an action class"""
 
+    __slots__ = ('_name', '_description', '_action_fn',
+                 '_entity_info', '_arguments', '_context_prefixes', '_context_roots')
+
     def __init__(self, name: str, description: str, action_fn: Callable, entity_info: EntityInfo) -> None:
-        self._name: str = name
+        # interned, as the name keys the action space lookups
+        self._name: str = sys.intern(name)
         self._description: str = description
         self._action_fn: Callable = action_fn
         self._entity_info: EntityInfo = entity_info
-        if not inspect.iscoroutinefunction(action_fn):
-            raise ValueError("Action function must be a coroutine function")
-        if not hasattr(action_fn, '__annotations__'):
-            raise ValueError("Action function must have type annotations")
-        # check if action_fn has caller_context argument of IState type
-        sig = inspect.signature(action_fn)
-        if 'caller_context' not in sig.parameters or sig.parameters['caller_context'].annotation != IState:
-            raise ValueError(
-                "Action function must have 'caller_context' argument of IState type or None")
+        # copied, the validated arguments are shared by every action wrapping the same function
+        self._arguments: Dict[str, str] = dict(_validate_action_fn(action_fn))
+
+        # caller context prefixes, from the most generic to the most specific
+        self._context_prefixes: Tuple[str, ...] = (
+            "_any",
+            f"_any.{name}",
+            f"{entity_info.name}._any",
+            f"{entity_info.name}.{name}",
+        )
+        # every prefix above starts with one of these
+        self._context_roots: Tuple[str, str] = ("_any", f"{entity_info.name}.")
 
     def name(self) -> str:
         """Returns the name of the action"""
@@ -37,26 +91,16 @@ class Action(IAction):
 
     def arguments(self) -> Dict[str, str]:
         """Returns the arguments of the action"""
-        sig = inspect.signature(self._action_fn)
-        args = {}
-        for name, value in sig.parameters.items():
-            if value.annotation.__class__.__name__ == "type":
-                args[name] = value.annotation.__name__
-            elif value.annotation.__class__.__name__ in ["UnionType", "_UnionGenericAlias"]:
-                args[name] = ' | '.join(
-                    arg.__name__ for arg in value.annotation.__args__)
-        return args
+        return self._arguments
 
     async def call(self, *, caller_context: IState, **kwargs) -> ActionResult:
         """Performs the action"""
-
-        context = caller_context.slice_by_prefix(f"_any")
-        context.merge(caller_context.slice_by_prefix(
-            f"_any.{self._name}"), None)
-        context.merge(caller_context.slice_by_prefix(
-            f"{self._entity_info.name}._any"), None)
-        context.merge(caller_context.slice_by_prefix(
-            f"{self._entity_info.name}.{self._name}"), None)
-
-        kwargs['caller_context'] = context
+        any_root, entity_root = self._context_roots
+        if type(caller_context) is State and not (
+                caller_context.has_any_with_prefix(any_root) or caller_context.has_any_with_prefix(entity_root)):
+            # nothing in the caller context is addressed to this action
+            kwargs['caller_context'] = State(caller_context._max_keys)
+        else:
+            kwargs['caller_context'] = slice_by_prefixes(
+                caller_context, self._context_prefixes)
         return await self._action_fn(**kwargs)
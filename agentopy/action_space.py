@@ -1,6 +1,4 @@
-from typing import List
-
-from collections import OrderedDict
+from typing import Dict, List
 
 from agentopy.protocols import IActionSpace, IAction
 
@@ -8,19 +6,22 @@ from agentopy.protocols import IActionSpace, IAction
 class ActionSpace(IActionSpace):
     """Implements a base action space class"""
 
+    __slots__ = ('_actions',)
+
     def __init__(self) -> None:
-        self._actions: OrderedDict[str, IAction] = OrderedDict()
+        self._actions: Dict[str, IAction] = {}
 
     def get_action(self, name: str) -> IAction:
         """Returns the action with the specified name"""
-        assert name in self._actions, f"Action {name} not found"
-        return self._actions[name]
+        action = self._actions.get(name)
+        if action is None:
+            raise KeyError(f"Action {name} not found")
+        return action
 
     def register_actions(self, actions: List[IAction]) -> None:
         """Registers the specified action in the action space"""
 
-        for action in actions:
-            self._actions[action.name()] = action
+        self._actions.update((action.name(), action) for action in actions)
 
     def all_actions(self) -> List[IAction]:
         return list(self._actions.values())
@@ -29,6 +30,9 @@ class ActionSpace(IActionSpace):
 class WithActionSpaceMixin:
     """Implements a mixin for classes that have an action space"""
 
+    # slotted subclasses declare '_action_space' themselves, so it can be mixed with other mixins
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__()
         self._action_space: IActionSpace = ActionSpace()
@@ -1,9 +1,12 @@
-from typing import List, Dict, Any, Iterable
+from typing import List, Dict, Any, Iterable, Optional, Callable, Awaitable, Tuple
+from itertools import chain
 import asyncio as aio
 import logging
 
 from agentopy.protocols import IAgent, IPolicy, IEnvironment, IAgentComponent, IAction
-from agentopy.schemas import SharedStateKeys
+from agentopy.schemas import (
+    AGENT_MODE, AGENT_THOUGHTS, AGENT_ACTION, AGENT_ACTION_RESULT, AGENT_ACTION_ARGS, AGENT_ACTION_CONTEXT
+)
 from agentopy.state import WithStateMixin
 
 logger = logging.getLogger('agent')
@@ -12,6 +15,9 @@ logger = logging.getLogger('agent')
 class Agent(WithStateMixin, IAgent):
     """Implements an agent that takes actions to achieve a goal"""
 
+    __slots__ = ('_state', '_policy', '_environment', '_components', '_heartrate_ms', '_concurrent_heartbeat',
+                 '_mode_cache', '_mode_handlers', '_heartbeat_callbacks')
+
     AGENT_MODE_OBSERVING = 'observing'
     AGENT_MODE_THINKING = 'thinking'
     AGENT_MODE_ACTING = 'acting'
@@ -21,24 +27,41 @@ class Agent(WithStateMixin, IAgent):
         policy: IPolicy,
         environment: IEnvironment,
         components: List[IAgentComponent],
-        heartrate_ms: float = 1000
+        heartrate_ms: float = 1000,
+        concurrent_heartbeat: Optional[bool] = None
     ):
-        """Initializes the agent with the specified name and policy"""
+        """
+        Initializes the agent with the specified name and policy.
+
+        If concurrent_heartbeat is set, component heartbeat callbacks run concurrently with the current mode's work;
+        by default this is enabled for asynchronous agents (heartrate_ms > 0).
+        """
         super().__init__()
         self._policy: IPolicy = policy
         self._environment: IEnvironment = environment
-        self._components: List[IAgentComponent] = components
+        self._components: Tuple[IAgentComponent, ...] = tuple(components)
         self._heartrate_ms: float = heartrate_ms
+        self._concurrent_heartbeat: bool = heartrate_ms > 0 if concurrent_heartbeat is None else concurrent_heartbeat
 
+        # mirrors the AGENT_MODE state item so reads don't go through the state
+        self._mode_cache: Optional[str] = None
         self._mode = self.AGENT_MODE_OBSERVING
 
-        for component in self._environment.components:
-            self.policy.action_space.register_actions(
-                component.action_space.all_actions())
+        # handlers per agent mode, in the order the modes follow each other
+        self._mode_handlers: Dict[str, Callable[[], Awaitable[None]]] = {
+            self.AGENT_MODE_OBSERVING: self.observe,
+            self.AGENT_MODE_THINKING: self.think,
+            self.AGENT_MODE_ACTING: self.act,
+        }
 
-        for component in self._components:
-            self.policy.action_space.register_actions(
-                component.action_space.all_actions())
+        self._heartbeat_callbacks: Tuple[Callable[[IAgent], Awaitable[None]], ...] = tuple(
+            component.on_agent_heartbeat for component in self._components)
+
+        self.policy.action_space.register_actions([
+            action
+            for component in chain(self._environment.components, self._components)
+            for action in component.action_space.all_actions()
+        ])
 
     @property
     def policy(self) -> IPolicy:
@@ -49,12 +72,13 @@ class Agent(WithStateMixin, IAgent):
         return self._environment
 
     @property
-    def _mode(self) -> str:
-        return self.state.get_item(SharedStateKeys.AGENT_MODE)
+    def _mode(self) -> Optional[str]:
+        return self._mode_cache
 
     @_mode.setter
     def _mode(self, value: str) -> None:
-        self.state.set_item(SharedStateKeys.AGENT_MODE, value)
+        self._mode_cache = value
+        self.state.set_item(AGENT_MODE, value)
 
     def info(self) -> Dict[str, Any]:
         """Returns information about the agent"""
@@ -63,6 +87,7 @@ class Agent(WithStateMixin, IAgent):
             "environment": self.environment.info(),
             "components": [component.info() for component in self._components],
             "heartrate_ms": self._heartrate_ms,
+            "concurrent_heartbeat": self._concurrent_heartbeat,
         }
 
     def start(self) -> Iterable[aio.Task]:
@@ -77,9 +102,19 @@ class Agent(WithStateMixin, IAgent):
                 await aio.sleep(0)
 
         async def start_agent():
+            loop = aio.get_running_loop()
+            interval = self._heartrate_ms / 1000
+            deadline = loop.time()
             while True:
                 await self.heartbeat()
-                await aio.sleep(self._heartrate_ms / 1000)
+                # keep a fixed cadence, regardless of how long the heartbeat took
+                deadline += interval
+                delay = deadline - loop.time()
+                if delay < 0:
+                    # the heartbeat overran its period, start over instead of catching up
+                    deadline -= delay
+                    delay = 0
+                await aio.sleep(delay)
 
         task = aio.create_task(start_agent())
         tasks.add(task)
@@ -94,10 +129,12 @@ class Agent(WithStateMixin, IAgent):
 
     async def observe(self) -> None:
         """Observe the environment and update the agent's internal state."""
-        for component_name, component_state in await self.environment.observe(self.state.slice_by_prefix(SharedStateKeys.AGENT_ACTION_CONTEXT)):
+        state = self.state
+        clear, merge = state.clear, state.merge
+        for component_name, component_state in await self.environment.observe(state.slice_by_prefix(AGENT_ACTION_CONTEXT)):
             prefix = f"environment.components.{component_name}."
-            self.state.clear(prefix)
-            self.state.merge(component_state, prefix)
+            clear(prefix)
+            merge(component_state, prefix)
 
         self._mode = self.AGENT_MODE_THINKING
 
@@ -109,17 +146,19 @@ class Agent(WithStateMixin, IAgent):
         action, arguments, thoughts = await self.policy.action(self.state)
 
         self._mode = self.AGENT_MODE_ACTING
-        self.state.set_item(SharedStateKeys.AGENT_ACTION, action)
-        self.state.set_item(SharedStateKeys.AGENT_ACTION_ARGS, arguments)
-        self.state.set_item(SharedStateKeys.AGENT_THOUGHTS, thoughts)
+        set_item = self.state.set_item
+        set_item(AGENT_ACTION, action)
+        set_item(AGENT_ACTION_ARGS, arguments)
+        set_item(AGENT_THOUGHTS, thoughts)
 
     async def act(self) -> None:
         """Perform the action that was decided on in the previous step and update the agent's state accordingly."""
-        action = self.state.get_item(SharedStateKeys.AGENT_ACTION)
-        arguments = self.state.get_item(SharedStateKeys.AGENT_ACTION_ARGS)
+        state = self.state
+        action = state.get_item(AGENT_ACTION)
+        arguments = state.get_item(AGENT_ACTION_ARGS)
 
         result = await action.call(**arguments)
-        self.state.set_item(SharedStateKeys.AGENT_ACTION_RESULT, result)
+        state.set_item(AGENT_ACTION_RESULT, result)
 
         self._mode = self.AGENT_MODE_OBSERVING
 
@@ -127,21 +166,28 @@ class Agent(WithStateMixin, IAgent):
         """The agent's heartbeat, which is called periodically to update the agent's internal state."""
         logger.info(f"Agent heartbeat in {self._mode} mode")
 
-        _ = [await component.on_agent_heartbeat(self) for component in self._components]
+        if self._concurrent_heartbeat:
+            # let both sides settle before failing, so the mode's work is never left running unobserved
+            results = await aio.gather(
+                *[callback(self) for callback in self._heartbeat_callbacks], self._run_mode(),
+                return_exceptions=True)
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+        else:
+            for callback in self._heartbeat_callbacks:
+                await callback(self)
+            await self._run_mode()
 
+    async def _run_mode(self) -> None:
+        """Runs the work of the current mode, or of all modes in turn if the heartbeat is synchronous"""
         if self._heartrate_ms == 0:
             # if heartrate_ms is 0, then the heartbeat is synchronous, so we do all modes in one heartbeat
-            if self._mode == self.AGENT_MODE_OBSERVING:
-                await self.observe()
-            if self._mode == self.AGENT_MODE_THINKING:
-                await self.think()
-            if self._mode == self.AGENT_MODE_ACTING:
-                await self.act()
+            for mode, handler in self._mode_handlers.items():
+                if self._mode == mode:
+                    await handler()
         else:
             # if heartrate_ms is not 0, then the heartbeat is asynchronous, so we do one mode per heartbeat
-            if self._mode == self.AGENT_MODE_OBSERVING:
-                await self.observe()
-            elif self._mode == self.AGENT_MODE_THINKING:
-                await self.think()
-            elif self._mode == self.AGENT_MODE_ACTING:
-                await self.act()
+            handler = self._mode_handlers.get(self._mode)
+            if handler is not None:
+                await handler()
@@ -1,15 +1,30 @@
 from typing import List, Tuple, Dict, Any, Iterable
 import asyncio as aio
+import logging
 
 from agentopy.protocols import IEnvironment, IEnvironmentComponent, IState
+from agentopy.state import merge_context, slice_by_prefixes
+
+logger = logging.getLogger('environment')
 
 
 class Environment(IEnvironment):
     """Implements a base environment class"""
 
+    __slots__ = ('_components', '_component_names', '_observe_prefixes')
+
+    # caller context prefixes shared by all components
+    OBSERVE_CONTEXT_PREFIXES = ("_any", "_any.observe")
+
     def __init__(self, components: List[IEnvironmentComponent]) -> None:
         """Initializes the environment with the specified state and components"""
-        self._components: List[IEnvironmentComponent] = components
+        self._components: Tuple[IEnvironmentComponent, ...] = tuple(components)
+        self._component_names: Tuple[str, ...] = tuple(
+            component.info().name for component in self._components)
+        # component specific caller context prefixes, from the most generic to the most specific
+        self._observe_prefixes: Tuple[Tuple[str, ...], ...] = tuple(
+            (f"{name}._any", f"{name}.observe") for name in self._component_names
+        )
 
     def start(self, sync=False) -> Iterable[aio.Task]:
         """Starts the environment and returns the tasks for the components"""
@@ -27,33 +42,51 @@ class Environment(IEnvironment):
         else:
             async def start_all_components():
                 while True:
-                    for component in self._components:
-                        await component.tick()
+                    # tick all components concurrently, one round at a time; a failure doesn't cancel
+                    # the rest of the round, but it ends the task as in the non-sync mode
+                    results = await aio.gather(
+                        *[component.tick() for component in self._components], return_exceptions=True)
+                    errors = [(name, result) for name, result in zip(self._component_names, results)
+                              if isinstance(result, BaseException)]
+                    for name, error in errors:
+                        logger.error(
+                            f"Component {name} failed to tick", exc_info=error)
+                    if errors:
+                        raise errors[0][1]
                     await aio.sleep(0)
 
             tasks.add(aio.create_task(start_all_components()))
         return tasks
 
     @property
-    def components(self) -> List[IEnvironmentComponent]:
+    def components(self) -> Tuple[IEnvironmentComponent, ...]:
         """Returns the components of the environment"""
         return self._components
 
     async def observe(self, caller_context: IState) -> List[Tuple[str, IState]]:
         """Returns the current state of the environment"""
-        states = []
-
-        for component in self._components:
-            context = caller_context.slice_by_prefix(f"_any")
-            context.merge(caller_context.slice_by_prefix(
-                f"_any.observe"), None)
-            context.merge(caller_context.slice_by_prefix(
-                f"{component.info().name}._any"), None)
-            context.merge(caller_context.slice_by_prefix(
-                f"{component.info().name}.observe"), None)
-            states.append(await component.observe(context))
-
-        return [(component.info().name, state) for component, state in zip(self._components, states)]
+        contexts = []
+        shared_context = slice_by_prefixes(
+            caller_context, self.OBSERVE_CONTEXT_PREFIXES)
+
+        has_any_with_prefix = caller_context.has_any_with_prefix
+        slice_by_prefix = caller_context.slice_by_prefix
+        for prefixes in self._observe_prefixes:
+            context = shared_context.clone()
+            for prefix in prefixes:
+                if has_any_with_prefix(prefix):
+                    merge_context(context, slice_by_prefix(prefix))
+            contexts.append(context)
+
+        # let every observation settle before failing, so none is left running unobserved
+        states = await aio.gather(
+            *[component.observe(context) for component, context in zip(self._components, contexts)],
+            return_exceptions=True)
+        for state in states:
+            if isinstance(state, BaseException):
+                raise state
+
+        return list(zip(self._component_names, states))
 
     def info(self) -> Dict[str, Any]:
         """Returns information about the environment"""
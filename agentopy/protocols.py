@@ -1,13 +1,14 @@
-from typing import Optional, List, Any, Tuple, Dict, Protocol, Iterable, runtime_checkable
+from typing import Optional, List, Any, Tuple, Dict, Mapping, Protocol, Iterable, Sequence
 import asyncio as aio
 
 from agentopy.schemas import ActionResult, EntityInfo
 
 
-@runtime_checkable
 class IState(Protocol):
     """Interface for a universal state object"""
 
+    __slots__ = ()
+
     def merge(self, other: 'IState', prefix: Optional[str]) -> None:
         """Merges the specified state into the current state"""
         ...
@@ -28,8 +29,8 @@ class IState(Protocol):
         """Returns state item with the specified key"""
         ...
 
-    def items(self) -> Dict[str, Any]:
-        """Returns the items in the state"""
+    def items(self) -> Mapping[str, Any]:
+        """Returns a read-only view of the items in the state"""
         ...
 
     def remove_item(self, key: str) -> None:
@@ -44,19 +45,33 @@ class IState(Protocol):
         """Returns a new state with items that have the specified prefix"""
         ...
 
+    def clone(self) -> 'IState':
+        """Returns a shallow copy of the state"""
+        # default for implementations predating clone: an emptied slice keeps the state's kind and capacity
+        state = self.slice_by_prefix("")
+        state.clear(None)
+        state.merge(self, None)
+        return state
+
+    def has_any_with_prefix(self, prefix: str) -> bool:
+        """Returns whether the state has any item with the specified prefix"""
+        return any(key.startswith(prefix) for key in self.items())
+
 
-@runtime_checkable
 class IStateful(Protocol):
+    __slots__ = ()
+
     @property
     def state(self) -> IState:
         """Returns the current state of the stateful object"""
         ...
 
 
-@runtime_checkable
 class IAction(Protocol):
     """Implements an action that can be taken"""
 
+    __slots__ = ()
+
     async def call(self, *args: Any, **kwargs: Any) -> ActionResult:
         """Performs the action"""
         ...
@@ -81,6 +96,8 @@ class IAction(Protocol):
 class IAgent(IStateful, Protocol):
     """Implements an autonomous agent that can interact with the environment"""
 
+    __slots__ = ()
+
     async def heartbeat(self) -> None:
         """Performs a single step of the agent's heartbeat and returns whether the agent is still alive"""
         ...
@@ -104,10 +121,11 @@ class IAgent(IStateful, Protocol):
         ...
 
 
-@runtime_checkable
 class IActionSpace(Protocol):
     """Implements an action space that can be interacted with"""
 
+    __slots__ = ()
+
     def get_action(self, name: str) -> IAction:
         """Returns the actions in the action space"""
         ...
@@ -124,6 +142,8 @@ class IActionSpace(Protocol):
 class IEnvironmentComponent(Protocol):
     """Implements an environment component that can be interacted with"""
 
+    __slots__ = ()
+
     @property
     def action_space(self) -> IActionSpace:
         """Returns the action space of the component"""
@@ -145,6 +165,8 @@ class IEnvironmentComponent(Protocol):
 class IAgentComponent(Protocol):
     """Implements an agent component"""
 
+    __slots__ = ()
+
     @property
     def action_space(self) -> IActionSpace:
         """Returns the action space of the component"""
@@ -163,16 +185,17 @@ class IAgentComponent(Protocol):
         ...
 
 
-@runtime_checkable
 class IEnvironment(Protocol):
     """Implements an environment that can be interacted with"""
 
+    __slots__ = ()
+
     async def observe(self, caller_context: IState) -> List[Tuple[str, IState]]:
         """Returns the current state of the environment for the specified observer"""
         ...
 
     @property
-    def components(self) -> List[IEnvironmentComponent]:
+    def components(self) -> Sequence[IEnvironmentComponent]:
         """Returns the components of the environment"""
         ...
 
@@ -185,10 +208,11 @@ class IEnvironment(Protocol):
         ...
 
 
-@runtime_checkable
 class IPolicy(Protocol):
     """Implements a policy that can be used to select actions"""
 
+    __slots__ = ()
+
     async def action(self, state: IState) -> Tuple[IAction, Dict[str, Any], Dict[str, Any]]:
         """Returns an action to take, along with its arguments and 'thoughts' on why action was chosen"""
         ...
@@ -1,26 +1,35 @@
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Dict, Final
+import sys
+
+# keys of the shared state, interned as they are looked up on every heartbeat
+AGENT_MODE: Final[str] = sys.intern("agent.mode")
+AGENT_THOUGHTS: Final[str] = sys.intern("agent.thoughts")
+AGENT_ACTION: Final[str] = sys.intern("agent.action.name")
+AGENT_ACTION_RESULT: Final[str] = sys.intern("agent.action.result")
+AGENT_ACTION_ARGS: Final[str] = sys.intern("agent.action.args")
+AGENT_ACTION_CONTEXT: Final[str] = sys.intern("agent.action_context")
 
 
 @dataclass
 class ActionResult:
     """Defines result of an action"""
+    __slots__ = ('value', 'success')
     value: Any
     success: bool
 
 
-@dataclass
 class SharedStateKeys:
     """Defines the keys for the shared state"""
-    AGENT_MODE: str = "agent.mode"
-    AGENT_THOUGHTS: str = "agent.thoughts"
-    AGENT_ACTION: str = "agent.action.name"
-    AGENT_ACTION_RESULT: str = "agent.action.result"
-    AGENT_ACTION_ARGS: str = "agent.action.args"
-    AGENT_ACTION_CONTEXT: str = "agent.action_context"
+    AGENT_MODE: Final[str] = AGENT_MODE
+    AGENT_THOUGHTS: Final[str] = AGENT_THOUGHTS
+    AGENT_ACTION: Final[str] = AGENT_ACTION
+    AGENT_ACTION_RESULT: Final[str] = AGENT_ACTION_RESULT
+    AGENT_ACTION_ARGS: Final[str] = AGENT_ACTION_ARGS
+    AGENT_ACTION_CONTEXT: Final[str] = AGENT_ACTION_CONTEXT
 
 
-@dataclass
+@dataclass(frozen=True)
 class EntityInfo:
     """Defines information about a component"""
     name: str
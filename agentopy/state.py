@@ -1,4 +1,5 @@
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, KeysView, List, Mapping, Optional, Tuple, Sequence
 
 from agentopy.protocols import IState
 
@@ -6,51 +7,96 @@ from agentopy.protocols import IState
 class State(IState):
     """Implements a universal state object"""
 
+    __slots__ = ('_data', '_view', '_max_keys')
+
     def __init__(self, max_keys: int = 50) -> None:
         """Initializes the state"""
         self._data: Dict[str, Any] = {}
+        self._view: Mapping[str, Any] = MappingProxyType(self._data)
         self._max_keys: int = max_keys
 
     def merge(self, other: IState, key_prefix: Optional[str]) -> None:
         """Merges the state with another state"""
-        for key, value in other.items().items():
-            if key_prefix:
-                key = f"{key_prefix}{key}"
-            self._data[key] = value
+        if key_prefix:
+            items = {key_prefix + key: value for key, value in other.items().items()}
+        else:
+            items = other.items()
+        self._check_capacity(items.keys())
+        self._data.update(items)
+
+    def _check_capacity(self, keys: KeysView[str]) -> None:
+        """Raises if adding the specified keys would exceed the state capacity"""
+        new_keys = keys - self._data.keys()
+        if new_keys and len(self._data) + len(new_keys) > self._max_keys:
+            raise Exception(f"State is full, cannot add {len(new_keys)} new items")
 
     def clear(self, prefix=None) -> None:
         """Clears the state"""
+        data = self._data
         if prefix is None:
-            self._data = {}
-        else:
-            # TODO: this is not efficient
-            self._data = {k: v for k, v in self._data.items()
-                          if not k.startswith(prefix)}
+            data.clear()
+            return
+        # delete in place, the items view is bound to this dict
+        for key in [key for key in data if key.startswith(prefix)]:
+            del data[key]
 
     def set_item(self, key: str, value: Any) -> None:
         """Adds the specified data items to the state"""
-        if key not in self._data and len(self._data) >= self._max_keys:
+        data = self._data
+        if key in data:
+            data[key] = value
+            return
+        if len(data) >= self._max_keys:
             raise Exception(f"State is full, cannot add item with key {key}")
-        self._data[key] = value
+        data[key] = value
 
     def set_nested_item(self, prefix: str, data: Dict[str, Any]) -> None:
         """Adds the specified data items to the state"""
-        def nest(prefix: str, data: Dict[str, Any]):
-            for key, value in data.items():
+        # flatten depth-first, in the order of the nested dicts
+        items = []
+        stack = [(prefix, iter(data.items()))]
+        while stack:
+            key_prefix, nested_items = stack[-1]
+            for key, value in nested_items:
+                key = f"{key_prefix}.{key}"
                 if isinstance(value, dict):
-                    nest(f"{prefix}.{key}", value)
-                else:
-                    self.set_item(f"{prefix}.{key}", value)
-        nest(prefix, data)
+                    stack.append((key, iter(value.items())))
+                    break
+                items.append((key, value))
+            else:
+                stack.pop()
+
+        free_keys = self._max_keys - len(self._data)
+        new_keys = set()
+        for key, _ in items:
+            if key not in self._data and key not in new_keys:
+                if len(new_keys) >= free_keys:
+                    raise Exception(f"State is full, cannot add item with key {key}")
+                new_keys.add(key)
+
+        self._data.update(items)
 
     def slice_by_prefix(self, prefix: str) -> IState:
         """Returns a new state with items that have the specified prefix"""
         state = State(self._max_keys)
+        # a slice never holds more items than this state, so skip the capacity checks
+        data = state._data
+        prefix_len = len(prefix)
         for key, value in self._data.items():
             if key.startswith(prefix):
                 if key != prefix:
-                    key = key[len(prefix):].lstrip('.')
-                state.set_item(key, value)
+                    key = key[prefix_len:].lstrip('.')
+                data[key] = value
+        return state
+
+    def has_any_with_prefix(self, prefix: str) -> bool:
+        """Returns whether the state has any item with the specified prefix"""
+        return any(key.startswith(prefix) for key in self._data)
+
+    def clone(self) -> IState:
+        """Returns a shallow copy of the state"""
+        state = State(self._max_keys)
+        state._data.update(self._data)
         return state
 
     def get_item(self, key: str) -> Any:
@@ -61,9 +107,9 @@ class State(IState):
         """Removes item with specified key"""
         self._data.pop(key, None)
 
-    def items(self) -> Dict[str, Any]:
-        """Returns the items in the state"""
-        return self._data
+    def items(self) -> Mapping[str, Any]:
+        """Returns a read-only view of the items in the state"""
+        return self._view
 
     def keys(self) -> List[str]:
         """Returns the keys in the state"""
@@ -72,10 +118,22 @@ class State(IState):
     def __dict__(self) -> Dict[str, Any]:
         return self._data
 
+    def __getstate__(self) -> Tuple[int, Dict[str, Any]]:
+        # the items view can't be pickled, it is recreated from the items
+        return self._max_keys, self._data
+
+    def __setstate__(self, state: Tuple[int, Dict[str, Any]]) -> None:
+        max_keys, data = state
+        State.__init__(self, max_keys)
+        self._data.update(data)
+
 
 class WithStateMixin:
     """Implements a mixin for classes that have a state"""
 
+    # '_state' is declared by slotted subclasses
+    __slots__ = ()
+
     def __init__(self, max_state_len: int = 50) -> None:
         """Initializes the mixin with the specified state"""
         super().__init__()
@@ -85,3 +143,25 @@ class WithStateMixin:
     def state(self) -> IState:
         """Returns the current state of the stateful object"""
         return self._state
+
+
+def merge_context(context: IState, other: IState) -> None:
+    """
+    Merges another state into a caller context built from slices.
+
+    Slices repeat keys of their source under stripped names, so a context may hold more items than the state it
+    was cut from; for concrete states the capacity check is skipped.
+    """
+    if type(context) is State:
+        context._data.update(other.items())
+    else:
+        context.merge(other, None)
+
+
+def slice_by_prefixes(state: IState, prefixes: Sequence[str]) -> IState:
+    """Returns a new state merging the slices of the specified prefixes, later prefixes taking precedence"""
+    context = state.slice_by_prefix(prefixes[0])
+    for prefix in prefixes[1:]:
+        if state.has_any_with_prefix(prefix):
+            merge_context(context, state.slice_by_prefix(prefix))
+    return context
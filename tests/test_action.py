@@ -0,0 +1,37 @@
+import pytest
+
+from agentopy import Action, EntityInfo, IState, State
+
+
+async def echo(caller_context: IState) -> IState:
+    return caller_context
+
+
+def make_action() -> Action:
+    return Action("act", "Returns its caller context", echo, EntityInfo(name="ent", params={}, version="0.1"))
+
+
+@pytest.mark.asyncio
+async def test_call_merges_context_prefixes_in_precedence_order():
+    caller_context = State()
+    caller_context.set_item("_any.x", 1)
+    caller_context.set_item("_any.act.x", 2)
+    caller_context.set_item("ent.act.x", 3)
+    caller_context.set_item("other.act.y", 4)
+
+    context = await make_action().call(caller_context=caller_context)
+
+    assert dict(context.items()) == {"x": 3, "act.x": 2}
+
+
+@pytest.mark.asyncio
+async def test_call_builds_context_from_a_full_state():
+    caller_context = State(4)
+    caller_context.set_item("_any.act.a", 1)
+    caller_context.set_item("_any.act.b", 2)
+    caller_context.set_item("ent.act.c", 3)
+    caller_context.set_item("ent.act.d", 4)
+
+    context = await make_action().call(caller_context=caller_context)
+
+    assert dict(context.items()) == {"act.a": 1, "act.b": 2, "a": 1, "b": 2, "c": 3, "d": 4}
@@ -0,0 +1,57 @@
+import asyncio as aio
+
+import pytest
+
+from agentopy import AGENT_MODE, Agent, Environment, EntityInfo, IAgent, IState, State, WithActionSpaceMixin
+
+
+class Policy(WithActionSpaceMixin):
+    def info(self) -> EntityInfo:
+        return EntityInfo(name="policy", params={}, version="0.1")
+
+    async def action(self, state: IState):
+        raise NotImplementedError
+
+
+class EnvironmentComponent(WithActionSpaceMixin):
+    def __init__(self, delay: float = 0) -> None:
+        super().__init__()
+        self._delay = delay
+        self.observed = False
+
+    def info(self) -> EntityInfo:
+        return EntityInfo(name="env_component", params={}, version="0.1")
+
+    async def tick(self) -> None:
+        pass
+
+    async def observe(self, caller_context: IState) -> IState:
+        await aio.sleep(self._delay)
+        self.observed = True
+        return State()
+
+
+class FailingAgentComponent(WithActionSpaceMixin):
+    def info(self) -> EntityInfo:
+        return EntityInfo(name="failing", params={}, version="0.1")
+
+    async def on_agent_heartbeat(self, agent: IAgent) -> None:
+        raise RuntimeError("boom")
+
+    async def tick(self) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_concurrent_heartbeat_failure_waits_for_mode_work():
+    env_component = EnvironmentComponent(delay=0.01)
+    agent = Agent(Policy(), Environment([env_component]), [FailingAgentComponent()], heartrate_ms=10)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await agent.heartbeat()
+
+    # the observation was not left running in the background after the failure was raised
+    assert env_component.observed
+    assert agent.state.get_item(AGENT_MODE) == Agent.AGENT_MODE_THINKING
+    await aio.sleep(0.02)
+    assert agent.state.get_item(AGENT_MODE) == Agent.AGENT_MODE_THINKING
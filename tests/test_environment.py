@@ -0,0 +1,65 @@
+import asyncio as aio
+
+import pytest
+
+from agentopy import Environment, EntityInfo, IState, State, WithActionSpaceMixin
+
+
+class Component(WithActionSpaceMixin):
+    def __init__(self, name: str, fail: bool = False, delay: float = 0) -> None:
+        super().__init__()
+        self._name = name
+        self._fail = fail
+        self._delay = delay
+        self.observed = False
+
+    def info(self) -> EntityInfo:
+        return EntityInfo(name=self._name, params={}, version="0.1")
+
+    async def tick(self) -> None:
+        pass
+
+    async def observe(self, caller_context: IState) -> IState:
+        await aio.sleep(self._delay)
+        if self._fail:
+            raise RuntimeError(f"{self._name} failed")
+        self.observed = True
+        return caller_context
+
+
+@pytest.mark.asyncio
+async def test_observe_returns_states_in_component_order():
+    environment = Environment([Component("a", delay=0.01), Component("b")])
+    caller_context = State()
+    caller_context.set_item("a.observe.x", 1)
+    caller_context.set_item("b.observe.y", 2)
+
+    observations = await environment.observe(caller_context)
+
+    assert [name for name, _ in observations] == ["a", "b"]
+    assert dict(observations[0][1].items()) == {"x": 1}
+    assert dict(observations[1][1].items()) == {"y": 2}
+
+
+@pytest.mark.asyncio
+async def test_observe_failure_waits_for_other_components():
+    slow = Component("slow", delay=0.01)
+    environment = Environment([Component("failing", fail=True), slow])
+
+    with pytest.raises(RuntimeError, match="failing failed"):
+        await environment.observe(State())
+
+    assert slow.observed
+
+
+@pytest.mark.asyncio
+async def test_observe_builds_contexts_from_a_full_state():
+    environment = Environment([Component("a")])
+    caller_context = State(3)
+    caller_context.set_item("_any.observe.x", 1)
+    caller_context.set_item("a._any.y", 2)
+    caller_context.set_item("a.observe.z", 3)
+
+    observations = await environment.observe(caller_context)
+
+    assert dict(observations[0][1].items()) == {"observe.x": 1, "x": 1, "y": 2, "z": 3}
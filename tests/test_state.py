@@ -0,0 +1,132 @@
+import pickle
+
+import pytest
+
+from agentopy import State
+
+
+def make_state(*keys: str, max_keys: int = 50) -> State:
+    state = State(max_keys)
+    for value, key in enumerate(keys):
+        state.set_item(key, value)
+    return state
+
+
+def test_set_item_updates_existing_key_when_full():
+    state = make_state("a", "b", max_keys=2)
+
+    state.set_item("a", 10)
+
+    assert dict(state.items()) == {"a": 10, "b": 1}
+    with pytest.raises(Exception, match="State is full"):
+        state.set_item("c", 2)
+
+
+def test_set_nested_item_flattens_in_order():
+    state = State()
+
+    state.set_nested_item("p", {"a": 1, "b": {"c": 2, "d": {"e": 3}}, "f": 4})
+
+    assert list(state.items().items()) == [("p.a", 1), ("p.b.c", 2), ("p.b.d.e", 3), ("p.f", 4)]
+
+
+def test_set_nested_item_is_all_or_nothing_when_full():
+    state = make_state("x", max_keys=2)
+
+    with pytest.raises(Exception, match="State is full"):
+        state.set_nested_item("p", {"a": 1, "b": 2})
+
+    assert state.keys() == ["x"]
+
+
+def test_clear_with_prefix_keeps_other_items():
+    state = make_state("a.x", "b.x", "a.y", "ab")
+
+    state.clear("a.")
+
+    assert dict(state.items()) == {"b.x": 1, "ab": 3}
+    assert not state.has_any_with_prefix("a.")
+    assert state.has_any_with_prefix("a")
+
+
+def test_clear_without_prefix_empties_the_state():
+    state = make_state("a", "b")
+    items = state.items()
+
+    state.clear(None)
+
+    assert state.keys() == []
+    assert len(items) == 0
+
+
+def test_slice_by_prefix_strips_prefix_and_keeps_order():
+    state = make_state("env.b", "agent.x", "env.a", "env")
+
+    sliced = state.slice_by_prefix("env")
+
+    assert list(sliced.items().items()) == [("b", 0), ("a", 2), ("env", 3)]
+    assert dict(state.slice_by_prefix("").items()) == dict(state.items())
+    assert state.slice_by_prefix("missing").keys() == []
+
+
+def test_merge_with_and_without_prefix():
+    state = make_state("a")
+    other = make_state("x", "y")
+
+    state.merge(other, "o.")
+    state.merge(other, None)
+
+    assert list(state.items().items()) == [("a", 0), ("o.x", 0), ("o.y", 1), ("x", 0), ("y", 1)]
+
+
+def test_merge_respects_capacity():
+    state = make_state("a", "x", max_keys=3)
+
+    state.merge(make_state("x"), None)
+    with pytest.raises(Exception, match="State is full"):
+        state.merge(make_state("y", "z"), None)
+
+    assert state.keys() == ["a", "x"]
+
+
+def test_clone_is_independent():
+    state = make_state("a", "b")
+
+    clone = state.clone()
+    clone.set_item("c", 2)
+    clone.remove_item("a")
+
+    assert state.keys() == ["a", "b"]
+    assert clone.keys() == ["b", "c"]
+
+
+def test_items_is_a_read_only_live_view():
+    state = make_state("a")
+    items = state.items()
+
+    with pytest.raises(TypeError):
+        items["b"] = 1
+    state.set_item("b", 1)
+
+    assert dict(items) == {"a": 0, "b": 1}
+
+
+def test_remove_item_ignores_missing_keys():
+    state = make_state("a", "b")
+
+    state.remove_item("a")
+    state.remove_item("missing")
+
+    assert state.keys() == ["b"]
+
+
+def test_state_round_trips_through_pickle():
+    state = make_state("a", "b.c", max_keys=2)
+
+    restored = pickle.loads(pickle.dumps(state))
+
+    assert list(restored.items().items()) == [("a", 0), ("b.c", 1)]
+    with pytest.raises(Exception, match="State is full"):
+        restored.set_item("d", 2)
+    restored.set_item("a", 5)
+    assert restored.items()["a"] == 5